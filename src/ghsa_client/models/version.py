@@ -1,14 +1,42 @@
 """Semantic version models using the semver package."""
 
+import operator as _op
 import re
+import string
+import sys
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from enum import Enum
-from functools import total_ordering
-from typing import Any
+from functools import lru_cache
 
 from packaging.version import Version as PyPIVersion
-from pydantic import BaseModel
 from semver import VersionInfo
 
+_PREFIX_RE = re.compile(r"^((?:.+@)?v|V)(.*)")
+
+# Characters allowed in semver prerelease and build identifiers
+_IDENTIFIER_CHARS = frozenset(string.ascii_letters + string.digits + "-")
+
+# Prerelease/build tag translations between semver and PyPI (PEP 440)
+_PYPI_TO_PRE = {"a": "alpha", "b": "beta", "rc": "rc"}
+_PRE_TO_PYPI = {"alpha": "a", "beta": "b", "rc": "rc"}
+_BUILD_TO_PYPI = {"dev": ".dev", "post": ".post"}
+
+# Predicate operator to VersionInfo rich-comparison method name
+_OPERATOR_MAP = {
+    "<": "__lt__",
+    "<=": "__le__",
+    ">": "__gt__",
+    ">=": "__ge__",
+    "!=": "__ne__",
+    "==": "__eq__",
+}
+
+# Predicate operator to the comparison function it applies
+_OPERATOR_FUNCS: dict[str, Callable[[VersionInfo, VersionInfo], bool]] = {
+    symbol: getattr(_op, name) for symbol, name in _OPERATOR_MAP.items()
+}
+
 
 class VersionFormat(Enum):
     """Version format enumeration."""
@@ -20,8 +48,76 @@ class VersionFormat(Enum):
     UNKNOWN = "unknown"
 
 
-@total_ordering
-class SemanticVersion(BaseModel):
+def _classify(version: str) -> VersionFormat:
+    """Guess the version format without running any parser.
+
+    A letter directly after a digit in the release part (before any '-' or
+    '+') can never be valid semver, so such inputs skip the semver parser.
+    RubyGems 'p' suffixes and Ubuntu suffixes are never valid PEP 440 either,
+    so those also skip the PyPI parser.
+    """
+    prev_is_digit = False
+    for i, char in enumerate(version):
+        if char in "-+":
+            break
+        if char.isalpha() and prev_is_digit:
+            if version.startswith("ubuntu", i):
+                return VersionFormat.UBUNTU
+            if char == "p" and version[i + 1 :].isdigit():
+                return VersionFormat.RUBYGEMS
+            return VersionFormat.PYPI
+        prev_is_digit = char.isdigit()
+    return VersionFormat.SEMVER
+
+
+def _is_numeric(part: str) -> bool:
+    """Check for a semver numeric identifier (ASCII digits, no leading zero)."""
+    return part.isascii() and part.isdigit() and (part == "0" or part[0] != "0")
+
+
+def _is_identifier(part: str) -> bool:
+    """Check for a non-empty semver identifier of [0-9A-Za-z-]."""
+    return bool(part) and _IDENTIFIER_CHARS.issuperset(part)
+
+
+def _fast_scan(
+    version: str,
+) -> tuple[int, int, int, str | None, str | None] | None:
+    """Split a plain 'MAJOR[.MINOR[.PATCH]][-pre][+build]' version.
+
+    Accepts only strings that semver's own parser accepts and returns the same
+    components, without going through its regex. Returns None for anything
+    else so the caller can fall back to the full parser.
+    """
+    rest, plus, build = version.partition("+")
+    core, dash, prerelease = rest.partition("-")
+
+    numbers = core.split(".")
+    if len(numbers) > 3 or not all(_is_numeric(number) for number in numbers):
+        return None
+
+    if dash:
+        for part in prerelease.split("."):
+            if not _is_identifier(part):
+                return None
+            if part.isdigit() and part != "0" and part[0] == "0":
+                return None
+
+    if plus and not all(_is_identifier(part) for part in build.split(".")):
+        return None
+
+    numbers += ["0"] * (3 - len(numbers))
+    return (
+        int(numbers[0]),
+        int(numbers[1]),
+        int(numbers[2]),
+        prerelease if dash else None,
+        build if plus else None,
+    )
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class SemanticVersion:
     """Enhanced semantic version supporting both semver and PyPI formats.
 
     This class can parse and convert between semantic versioning (semver) and
@@ -29,17 +125,46 @@ class SemanticVersion(BaseModel):
     and provides conversion methods.
 
     Attributes:
-        semver_parts: Internal semver representation as a dictionary
+        major: Major version number
+        minor: Minor version number
+        patch: Patch version number
+        prerelease: Semver prerelease tag, if any
+        build: Semver build metadata, if any
         original_version: The original version string that was parsed
         prefix: Any prefix (like 'v' or 'V') that was stripped
         version_format: The detected format (SEMVER, PYPI, or UNKNOWN)
     """
 
-    semver_parts: dict[str, Any]
+    major: int
+    minor: int
+    patch: int
+    prerelease: str | None = None
+    build: str | None = None
     original_version: str
     prefix: str = ""
     version_format: VersionFormat = VersionFormat.SEMVER
 
+    _version_info: VersionInfo = field(init=False, repr=False, compare=False)
+    _variations: tuple[str, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Intern repeated strings and build the VersionInfo once."""
+        # Advisories repeat a small set of version strings across many objects
+        for name in ("original_version", "prefix", "prerelease", "build"):
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, name, sys.intern(value))
+
+        object.__setattr__(
+            self,
+            "_version_info",
+            VersionInfo(
+                self.major, self.minor, self.patch, self.prerelease, self.build
+            ),
+        )
+
     @property
     def installable_version(self) -> str:
         return (
@@ -48,31 +173,25 @@ class SemanticVersion(BaseModel):
             else str(self)
         )
 
-    @classmethod
-    def parse(cls, version: str) -> "SemanticVersion":
-        """Parse version string using error-driven approach."""
-        original_version = version
-        prefix = ""
-
-        # Extract prefix if present
-        if match := re.match("^((?:.+@)?v|V)(.*)", version):
-            prefix = match.group(1)
-            version = match.group(2)
-
-        # Try parsers in order of preference
-        for parser in [
-            cls._parse_semver,
-            cls._parse_pypi,
-            cls._parse_rubygems,
-            cls._parse_ubuntu,
-            cls._parse_legacy,
-        ]:
-            try:
-                return parser(version, prefix, original_version)
-            except ValueError:
-                continue
-
-        raise ValueError(f"Invalid version: {version}")
+    @staticmethod
+    def parse(version: str) -> "SemanticVersion":
+        """Parse version string.
+
+        Results are memoized by version string, since advisories repeat the
+        same handful of versions across many predicates. Instances are
+        immutable, so the shared cached instance is returned directly; it is
+        always a SemanticVersion, even when called through a subclass.
+        """
+        return _parse_cached(version)
+
+    @staticmethod
+    def parse_many(versions: Iterable[str]) -> list["SemanticVersion"]:
+        """Parse a batch of version strings, parsing each distinct string once."""
+        versions = list(versions)
+        parsed = {
+            version: _parse_cached(version) for version in dict.fromkeys(versions)
+        }
+        return [parsed[version] for version in versions]
 
     @classmethod
     def _parse_pypi(
@@ -85,16 +204,12 @@ class SemanticVersion(BaseModel):
         prerelease = cls._convert_pypi_prerelease(pypi_version.pre)
         build = cls._convert_pypi_build(pypi_version.dev, pypi_version.post)
 
-        semver_version = VersionInfo(
+        return cls(
             major=pypi_version.major,
             minor=pypi_version.minor or 0,
             patch=pypi_version.micro or 0,
             prerelease=prerelease,
             build=build,
-        )
-
-        return cls(
-            semver_parts=semver_version.to_dict(),
             prefix=prefix,
             original_version=original_version,
             version_format=VersionFormat.PYPI,
@@ -107,8 +222,7 @@ class SemanticVersion(BaseModel):
             return None
 
         pre_type, pre_num = pre
-        pre_type_map = {"a": "alpha", "b": "beta", "rc": "rc"}
-        return f"{pre_type_map.get(pre_type, pre_type)}.{pre_num}"
+        return f"{_PYPI_TO_PRE.get(pre_type, pre_type)}.{pre_num}"
 
     @classmethod
     def _convert_pypi_build(cls, dev: int | None, post: int | None) -> str | None:
@@ -137,16 +251,11 @@ class SemanticVersion(BaseModel):
 
         # Convert RubyGems patch suffix to semver build metadata
         # "p12" becomes build metadata "+p12"
-        semver_version = VersionInfo(
+        return cls(
             major=major,
             minor=minor,
             patch=patch,
-            prerelease=None,
             build=patch_suffix,  # "p12" as build metadata
-        )
-
-        return cls(
-            semver_parts=semver_version.to_dict(),
             prefix=prefix,
             original_version=original_version,
             version_format=VersionFormat.RUBYGEMS,
@@ -169,16 +278,11 @@ class SemanticVersion(BaseModel):
 
         # Convert Ubuntu suffix to semver build metadata
         # "ubuntu7.5" becomes build metadata "+ubuntu7.5"
-        semver_version = VersionInfo(
+        return cls(
             major=major,
             minor=minor,
             patch=patch,
-            prerelease=None,
             build=ubuntu_suffix,  # "ubuntu7.5" as build metadata
-        )
-
-        return cls(
-            semver_parts=semver_version.to_dict(),
             prefix=prefix,
             original_version=original_version,
             version_format=VersionFormat.UBUNTU,
@@ -189,9 +293,24 @@ class SemanticVersion(BaseModel):
         cls, version: str, prefix: str, original_version: str
     ) -> "SemanticVersion":
         """Parse semver version."""
-        semver_version = VersionInfo.parse(version, optional_minor_and_patch=True)
+        parts = _fast_scan(version)
+        if parts is None:
+            semver_version = VersionInfo.parse(version, optional_minor_and_patch=True)
+            parts = (
+                semver_version.major,
+                semver_version.minor,
+                semver_version.patch,
+                semver_version.prerelease,
+                semver_version.build,
+            )
+
+        major, minor, patch, prerelease, build = parts
         return cls(
-            semver_parts=semver_version.to_dict(),
+            major=major,
+            minor=minor,
+            patch=patch,
+            prerelease=prerelease,
+            build=build,
             prefix=prefix,
             original_version=original_version,
             version_format=VersionFormat.SEMVER,
@@ -209,7 +328,11 @@ class SemanticVersion(BaseModel):
 
         semver_version = VersionInfo.parse(version, optional_minor_and_patch=True)
         return cls(
-            semver_parts=semver_version.to_dict(),
+            major=semver_version.major,
+            minor=semver_version.minor,
+            patch=semver_version.patch,
+            prerelease=semver_version.prerelease,
+            build=semver_version.build,
             prefix=prefix,
             original_version=original_version,
             version_format=VersionFormat.UNKNOWN,
@@ -218,44 +341,70 @@ class SemanticVersion(BaseModel):
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, SemanticVersion):
             raise NotImplementedError
-        return self.version_info == other.version_info
+        return self._version_info == other._version_info
+
+    def __hash__(self) -> int:
+        return hash(self._version_info)
+
+    def __ne__(self, other: object) -> bool:
+        if not isinstance(other, SemanticVersion):
+            raise NotImplementedError
+        return self._version_info != other._version_info
 
     def __lt__(self, other: "SemanticVersion") -> bool:
-        return self.version_info < other.version_info
+        return self._version_info < other._version_info
+
+    def __le__(self, other: "SemanticVersion") -> bool:
+        return self._version_info <= other._version_info
+
+    def __gt__(self, other: "SemanticVersion") -> bool:
+        return self._version_info > other._version_info
+
+    def __ge__(self, other: "SemanticVersion") -> bool:
+        return self._version_info >= other._version_info
 
     def __repr__(self) -> str:
         return f'SemanticVersion("{str(self)}")'
 
     def __str__(self) -> str:
-        version_str = str(self.version_info)
+        version_str = str(self._version_info)
         if self.prefix:
             return f"{self.prefix}{version_str}"
         return version_str
 
     def matches_predicate(self, predicate: "VersionPredicate") -> bool:
         """Check if this version matches a version predicate."""
-        return self.version_info.match(str(predicate))
+        compare = predicate._compare
+        if compare is None:
+            raise ValueError(f"Invalid operator: {predicate.operator}")
+        return compare(self._version_info, predicate.semver._version_info)
 
     @property
-    def variations(self) -> list[str]:
-        """Get all variations of the version."""
-        variations = [str(self.version_info)]
+    def variations(self) -> tuple[str, ...]:
+        """Get all distinct variations of the version."""
+        if self._variations is not None:
+            return self._variations
+
+        version_str = str(self._version_info)
+        variations = [version_str]
 
         if self.original_version:
             variations.append(self.original_version)
 
         if self.prefix:
-            variations.append(str(self.version_info))
+            variations.append(f"{self.prefix}{version_str}")
 
-        return variations
+        unique_variations = tuple(dict.fromkeys(variations))
+        object.__setattr__(self, "_variations", unique_variations)
+        return unique_variations
 
     @property
     def version_info(self) -> VersionInfo:
-        return VersionInfo(**self.semver_parts)
+        return self._version_info
 
     def to_pypi(self) -> str:
         """Convert to PyPI version format."""
-        version_info = self.version_info
+        version_info = self._version_info
         pypi_version = f"{version_info.major}.{version_info.minor}.{version_info.patch}"
 
         # Add prerelease
@@ -272,30 +421,85 @@ class SemanticVersion(BaseModel):
 
     def _convert_semver_prerelease_to_pypi(self, prerelease: str) -> str:
         """Convert semver prerelease to PyPI format."""
-        if prerelease.startswith("alpha."):
-            return f"a{prerelease.split('.')[1]}"
-        elif prerelease.startswith("beta."):
-            return f"b{prerelease.split('.')[1]}"
-        elif prerelease.startswith("rc."):
-            return f"rc{prerelease.split('.')[1]}"
-        else:
+        tag, sep, rest = prerelease.partition(".")
+        suffix = _PRE_TO_PYPI.get(tag)
+        if suffix is None or not sep:
             return f"-{prerelease}"
+        return f"{suffix}{rest.partition('.')[0]}"
 
     def _convert_semver_build_to_pypi(self, build: str) -> str:
         """Convert semver build metadata to PyPI format."""
-        if build.startswith("dev."):
-            return f".dev{build.split('.')[1]}"
-        elif build.startswith("post."):
-            return f".post{build.split('.')[1]}"
-        else:
+        tag, sep, rest = build.partition(".")
+        suffix = _BUILD_TO_PYPI.get(tag)
+        if suffix is None or not sep:
             return f"+{build}"
+        return f"{suffix}{rest.partition('.')[0]}"
 
     def to_semver(self) -> str:
         """Convert to semver format."""
-        return str(self.version_info)
+        return str(self._version_info)
+
+
+# Parser cascade for each classified format. Every list keeps the original
+# order of preference and only drops parsers that cannot accept the input.
+_FULL_CASCADE = (
+    SemanticVersion._parse_semver,
+    SemanticVersion._parse_pypi,
+    SemanticVersion._parse_rubygems,
+    SemanticVersion._parse_ubuntu,
+    SemanticVersion._parse_legacy,
+)
+_PARSERS_BY_FORMAT = {
+    VersionFormat.SEMVER: _FULL_CASCADE,
+    VersionFormat.PYPI: (
+        SemanticVersion._parse_pypi,
+        SemanticVersion._parse_rubygems,
+        SemanticVersion._parse_ubuntu,
+        SemanticVersion._parse_legacy,
+    ),
+    VersionFormat.RUBYGEMS: (
+        SemanticVersion._parse_rubygems,
+        SemanticVersion._parse_ubuntu,
+        SemanticVersion._parse_legacy,
+    ),
+    VersionFormat.UBUNTU: (
+        SemanticVersion._parse_ubuntu,
+        SemanticVersion._parse_legacy,
+    ),
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(version: str) -> SemanticVersion:
+    """Parse a version string into a SemanticVersion.
+
+    The format guessed by _classify picks which parsers to try; a parser
+    that still rejects the input falls through to the next one.
+    """
+    original_version = version
+    prefix = ""
+
+    # Extract prefix if present; only "name@v" prefixes need the regex
+    if "@" not in version:
+        if version[:1] in ("v", "V"):
+            prefix = version[0]
+            version = version[1:]
+    elif match := _PREFIX_RE.match(version):
+        prefix = match.group(1)
+        version = match.group(2)
+
+    # Try parsers in order of preference, skipping those known to fail
+    for parser in _PARSERS_BY_FORMAT.get(_classify(version), _FULL_CASCADE):
+        try:
+            return parser(version, prefix, original_version)
+        except ValueError:
+            continue
+
+    raise ValueError(f"Invalid version: {version}")
 
 
-class VersionPredicate(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class VersionPredicate:
     """Version predicate for comparison operations.
 
     Supports both semver and PyPI version formats with automatic detection
@@ -310,35 +514,37 @@ class VersionPredicate(BaseModel):
     operator: str
     version: str
     version_format: VersionFormat = VersionFormat.SEMVER
+    semver: SemanticVersion = field(init=False, repr=False, compare=False)
+    _compare: Callable[[VersionInfo, VersionInfo], bool] | None = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "semver", SemanticVersion.parse(self.version))
+        object.__setattr__(self, "_compare", _OPERATOR_FUNCS.get(self.operator))
 
     def __repr__(self) -> str:
         return f'VersionPredicate("{str(self)}")'
 
     def operator_to_symbol(self) -> str:
         """Convert operator to method name."""
-        operator_map = {
-            "<": "__lt__",
-            "<=": "__le__",
-            ">": "__gt__",
-            ">=": "__ge__",
-            "!=": "__ne__",
-            "==": "__eq__",
-        }
-        if self.operator not in operator_map:
+        if self.operator not in _OPERATOR_MAP:
             raise ValueError(f"Invalid operator: {self.operator}")
-        return operator_map[self.operator]
+        return _OPERATOR_MAP[self.operator]
 
     @classmethod
     def from_str(cls, s: str) -> "VersionPredicate":
         """Parse version predicate from string."""
         s = s.strip()
 
-        match = re.match(r"^(!=|<=|>=|<|>|==|=)\s*(.*)", s)
-        if not match:
+        # Two-character operators must be checked before their one-character prefixes
+        if s[:2] in ("!=", "<=", ">=", "=="):
+            operator, version_str = s[:2], s[2:]
+        elif s[:1] in ("<", ">", "="):
+            operator, version_str = s[:1], s[1:]
+        else:
             raise ValueError("Invalid version predicate format")
-
-        operator = match.group(1)
-        version_str = match.group(2)
+        version_str = version_str.lstrip()
 
         if operator == "=":
             operator = "=="
@@ -346,7 +552,7 @@ class VersionPredicate(BaseModel):
         # Parse and normalize the version to ensure consistency
         try:
             normalized_version = SemanticVersion.parse(version_str)
-            normalized_version_str = str(normalized_version.version_info)
+            normalized_version_str = str(normalized_version._version_info)
 
             return cls(
                 operator=operator,
@@ -359,10 +565,6 @@ class VersionPredicate(BaseModel):
     def __str__(self) -> str:
         return f"{self.operator}{str(self.version)}"
 
-    @property
-    def semver(self) -> SemanticVersion:
-        return SemanticVersion.parse(self.version)
-
     def to_pypi_predicate(self) -> str:
         """Convert predicate to PyPI format."""
         semver_version = self.semver
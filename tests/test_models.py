@@ -10,6 +10,7 @@ from ghsa_client.models import (
     Package,
     Vulnerability,
 )
+from ghsa_client.models.version import SemanticVersion
 
 
 class TestGHSA_ID:
@@ -138,6 +139,36 @@ class TestPackage:
         assert package1 != package3
 
 
+class TestVulnerability:
+    def test_vulnerability_schema(self) -> None:
+        """Test the version predicate schema exposes only its public fields."""
+        schema = Vulnerability.model_json_schema()
+        assert set(schema["$defs"]) == {
+            "Ecosystem",
+            "Package",
+            "VersionFormat",
+            "VersionPredicate",
+        }
+
+        predicate_schema = schema["$defs"]["VersionPredicate"]
+        assert predicate_schema["properties"] == {
+            "operator": {"title": "Operator", "type": "string"},
+            "version": {"title": "Version", "type": "string"},
+            "version_format": {"$ref": "#/$defs/VersionFormat", "default": "semver"},
+        }
+        assert predicate_schema["required"] == ["operator", "version"]
+
+    def test_vulnerability_predicates_match(self) -> None:
+        """Test parsed version ranges compare against their own versions."""
+        package = Package(name="test-package", ecosystem=Ecosystem.PIP)
+        vulnerability = Vulnerability(
+            package=package, vulnerable_version_range=">= 1.0, < 2.0a1"
+        )
+        lower, upper = vulnerability.vulnerable_version_range
+        assert lower.semver == SemanticVersion.parse("1.0.0")
+        assert upper.semver == SemanticVersion.parse("2.0.0-alpha.1")
+
+
 class TestAdvisory:
     def test_advisory_creation(self) -> None:
         """Test advisory model creation."""
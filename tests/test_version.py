@@ -2,7 +2,12 @@
 
 import pytest
 
-from ghsa_client.models.version import SemanticVersion, VersionFormat, VersionPredicate
+from ghsa_client.models.version import (
+    SemanticVersion,
+    VersionFormat,
+    VersionPredicate,
+    _classify,
+)
 
 
 class TestSemanticVersion:
@@ -22,6 +27,9 @@ class TestSemanticVersion:
         version = SemanticVersion.parse("1.0.0-alpha.1")
         assert version.version_format == VersionFormat.SEMVER
         assert version.version_info.prerelease == "alpha.1"
+        assert (version.major, version.minor, version.patch) == (1, 0, 0)
+        assert version.prerelease == "alpha.1"
+        assert version.build is None
         assert str(version) == "1.0.0-alpha.1"
 
     def test_parse_semver_with_build(self) -> None:
@@ -31,6 +39,14 @@ class TestSemanticVersion:
         assert version.version_info.build == "build.1"
         assert str(version) == "1.0.0+build.1"
 
+    def test_parse_semver_with_prerelease_and_build(self) -> None:
+        """Test parsing semver with hyphenated prerelease and build metadata."""
+        version = SemanticVersion.parse("1.0.0-x-y.0+build-1.02")
+        assert version.version_format == VersionFormat.SEMVER
+        assert version.version_info.prerelease == "x-y.0"
+        assert version.version_info.build == "build-1.02"
+        assert str(version) == "1.0.0-x-y.0+build-1.02"
+
     def test_parse_pypi_version(self) -> None:
         """Test parsing PyPI versions."""
         version = SemanticVersion.parse("1.0.0")
@@ -86,6 +102,13 @@ class TestSemanticVersion:
         assert version.version_info.major == 1
         assert str(version) == "v1.0.0"
 
+    def test_parse_with_package_prefix(self) -> None:
+        """Test parsing versions with a 'name@v' prefix."""
+        version = SemanticVersion.parse("pkg@v1.2.3")
+        assert version.prefix == "pkg@v"
+        assert version.version_info.minor == 2
+        assert version.installable_version == "1.2.3"
+
     def test_to_pypi_conversion(self) -> None:
         """Test conversion to PyPI format."""
         # Test semver to PyPI
@@ -101,6 +124,12 @@ class TestSemanticVersion:
         version = SemanticVersion.parse("1.0.0+build.1")
         assert version.to_pypi() == "1.0.0+build.1"
 
+        version = SemanticVersion.parse("1.0.0.post1")
+        assert version.to_pypi() == "1.0.0.post1"
+
+        version = SemanticVersion.parse("1.0.0-alpha")
+        assert version.to_pypi() == "1.0.0-alpha"
+
     def test_to_semver_conversion(self) -> None:
         """Test conversion to semver format."""
         version = SemanticVersion.parse("1.0.0a1")
@@ -121,6 +150,11 @@ class TestSemanticVersion:
         assert v1 < v2
         assert v3 < v1
         assert v1 == SemanticVersion.parse("1.0.0")
+        assert v1 != v2
+        assert v1 <= SemanticVersion.parse("1.0.0")
+        assert v2 > v1
+        assert v1 >= v3
+        assert sorted([v2, v1, v3]) == [v3, v1, v2]
 
     def test_installable_version(self) -> None:
         """Test installable version property."""
@@ -136,6 +170,43 @@ class TestSemanticVersion:
         variations = version.variations
         assert "1.0.0" in variations
         assert "v1.0.0" in variations
+        assert len(variations) == len(set(variations))
+
+        version = SemanticVersion.parse("4.2")
+        assert version.variations == ("4.2.0", "4.2")
+
+    def test_parse_many(self) -> None:
+        """Test parsing a batch of versions."""
+        versions = SemanticVersion.parse_many(["1.0.0", "v1.0.0a1", "1.0.0", "4.2"])
+        assert [str(version) for version in versions] == [
+            "1.0.0",
+            "v1.0.0-alpha.1",
+            "1.0.0",
+            "4.2.0",
+        ]
+        assert versions[0] is versions[2]
+
+        with pytest.raises(ValueError, match="Invalid version"):
+            SemanticVersion.parse_many(["1.0.0", "invalid-version"])
+
+    def test_classify_version_format(self) -> None:
+        """Test format classification ahead of parsing."""
+        assert _classify("1.0.0") == VersionFormat.SEMVER
+        assert _classify("1.0.0-alpha1") == VersionFormat.SEMVER
+        assert _classify("1.0.0+ubuntu1") == VersionFormat.SEMVER
+        assert _classify("1.0.0a1") == VersionFormat.PYPI
+        assert _classify("1.0.0p") == VersionFormat.PYPI
+        assert _classify("1.0p1") == VersionFormat.RUBYGEMS
+        assert _classify("4.25.14p12") == VersionFormat.RUBYGEMS
+        assert _classify("0.8.3ubuntu7.5") == VersionFormat.UBUNTU
+
+        version = SemanticVersion.parse("1.0.0+ubuntu1")
+        assert version.version_format == VersionFormat.SEMVER
+        assert version.version_info.build == "ubuntu1"
+
+        for invalid in ("1.0p1", "1.0.0p"):
+            with pytest.raises(ValueError, match="Invalid version"):
+                SemanticVersion.parse(invalid)
 
     def test_invalid_version(self) -> None:
         """Test handling of invalid versions."""
@@ -227,6 +298,8 @@ class TestVersionPredicate:
         assert predicate.operator == ">="
         assert predicate.version == "1.0.0-alpha.1"  # Should be normalized to semver
         assert predicate.version_format == VersionFormat.PYPI
+        assert predicate.semver == SemanticVersion.parse("1.0.0-alpha.1")
+        assert predicate.semver.version_format == VersionFormat.SEMVER
 
     def test_parse_predicate_with_spaces(self) -> None:
         """Test parsing predicates with spaces."""
@@ -242,6 +315,10 @@ class TestVersionPredicate:
         predicate2 = VersionPredicate.from_str("==1.0.0")
         assert predicate2.operator == "=="
 
+        predicate3 = VersionPredicate.from_str("!= 1.0.0")
+        assert predicate3.operator == "!="
+        assert predicate3.version == "1.0.0"
+
     def test_to_pypi_predicate(self) -> None:
         """Test conversion to PyPI predicate format."""
         predicate = VersionPredicate.from_str(">=1.0.0-alpha.1")
@@ -264,6 +341,9 @@ class TestVersionPredicate:
         with pytest.raises(ValueError, match="Invalid version predicate format"):
             VersionPredicate.from_str("invalid-predicate")
 
+        with pytest.raises(ValueError, match="Invalid version predicate format"):
+            VersionPredicate.from_str("!1.0.0")
+
     def test_operator_to_symbol(self) -> None:
         """Test operator to symbol conversion."""
         predicate = VersionPredicate.from_str(">=1.0.0")
@@ -275,9 +355,20 @@ class TestVersionPredicate:
     def test_invalid_operator(self) -> None:
         """Test handling of invalid operators."""
         predicate = VersionPredicate(operator="invalid", version="1.0.0")
+        assert predicate.semver == SemanticVersion.parse("1.0.0")
         with pytest.raises(ValueError, match="Invalid operator"):
             predicate.operator_to_symbol()
 
+    def test_predicate_semver_is_normalized(self) -> None:
+        """Test that semver reflects the normalized version, not the raw input."""
+        predicate = VersionPredicate.from_str("<pkg@v2.0")
+        assert str(predicate.semver) == "2.0.0"
+        assert predicate.semver.installable_version == "2.0.0"
+        assert predicate.semver.version_format == VersionFormat.SEMVER
+
+        direct = VersionPredicate(operator=">=", version="1.0.0")
+        assert VersionPredicate.from_str(">=v1.0.0").semver is direct.semver
+
     def test_version_predicate(self) -> None:
         predicate = VersionPredicate.from_str(">=4.2")
         assert predicate is not None
@@ -339,6 +430,16 @@ class TestVersionIntegration:
         predicate = VersionPredicate.from_str(">1.0.0")
         assert not version.matches_predicate(predicate)
 
+        predicate = VersionPredicate.from_str("!=1.0.0")
+        assert not version.matches_predicate(predicate)
+
+        predicate = VersionPredicate.from_str("<1.0.1a1")
+        assert version.matches_predicate(predicate)
+
+        predicate = VersionPredicate(operator="invalid", version="1.0.0")
+        with pytest.raises(ValueError, match="Invalid operator"):
+            version.matches_predicate(predicate)
+
     def test_mixed_format_comparison(self) -> None:
         """Test comparison between different format versions."""
         semver_version = SemanticVersion.parse("1.0.0")